@@ -1,7 +1,10 @@
 from shortuuid.main import decode
+from shortuuid.main import decode_int
 from shortuuid.main import encode
+from shortuuid.main import encode_int
 from shortuuid.main import get_alphabet
 from shortuuid.main import random
+from shortuuid.main import random_many
 from shortuuid.main import set_alphabet
 from shortuuid.main import ShortUUID
 from shortuuid.main import uuid
@@ -9,9 +12,12 @@ from shortuuid.main import uuid
 __version__ = "1.0.11"
 __all__ = [
     "decode",
+    "decode_int",
     "encode",
+    "encode_int",
     "get_alphabet",
     "random",
+    "random_many",
     "set_alphabet",
     "ShortUUID",
     "uuid",
@@ -21,15 +21,16 @@ class ShortUUIDField(models.CharField):
             kwargs["max_length"] = self.length + len(self.prefix)  # type: ignore
 
         self.alphabet: str = kwargs.pop("alphabet", None)  # type: ignore
+        self._shortuuid = ShortUUID(
+            alphabet=self.alphabet, dont_sort_alphabet=self.dont_sort_alphabet
+        )
         kwargs["default"] = self._generate_uuid  # type: ignore
 
         super().__init__(*args, **kwargs)
 
     def _generate_uuid(self) -> str:
         """Generate a short random string."""
-        return self.prefix + ShortUUID(
-            alphabet=self.alphabet, dont_sort_alphabet=self.dont_sort_alphabet
-        ).random(length=self.length)
+        return self.prefix + self._shortuuid.random(length=self.length)
 
     def deconstruct(self) -> Tuple[str, str, Tuple, Dict[str, Any]]:
         name, path, args, kwargs = super().deconstruct()
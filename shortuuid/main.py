@@ -3,33 +3,44 @@
 import math
 import secrets
 import uuid as _uu
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
+
+# Unambiguous lowercase/uppercase/digit characters, already unique and sorted.
+DEFAULT_ALPHABET = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ" "abcdefghijkmnopqrstuvwxyz"
+
+# Derived state for the default alphabet, filled in by the first default
+# ShortUUID and shared by reference with every later one. Safe to share
+# because set_alphabet always replaces these values instead of mutating them.
+_DEFAULT_STATE: Dict[str, Any] = {}
 
 
 def int_to_string(
-    number: int, alphabet: List[str], padding: Optional[int] = None
+    number: int, alphabet: Sequence[str], padding: Optional[int] = None
 ) -> str:
     """
     Convert a number to a string, using the given alphabet.
 
     The output has the most significant digit first.
     """
-    output = ""
+    chars: List[str] = []
+    append = chars.append
     alpha_len = len(alphabet)
     while number:
         number, digit = divmod(number, alpha_len)
-        output += alphabet[digit]
+        append(alphabet[digit])
+    output = "".join(chars[::-1])
     if padding:
-        remainder = max(padding - len(output), 0)
-        output = output + alphabet[0] * remainder
-    return output[::-1]
+        output = output.rjust(padding, alphabet[0])
+    return output
 
 
 def string_to_int(
     string: str,
-    alphabet: List[str],
+    alphabet: Sequence[str],
     alphabet_index: Optional[Dict[str, int]] = None,
 ) -> int:
     """
@@ -46,30 +57,48 @@ def string_to_int(
         alphabet_index = {char: idx for idx, char in enumerate(alphabet)}
     number = 0
     alpha_len = len(alphabet)
+    lookup = alphabet_index.__getitem__
     for char in string:
         try:
-            number = number * alpha_len + alphabet_index[char]
+            number = number * alpha_len + lookup(char)
         except KeyError:
             raise ValueError("'{}' is not in alphabet".format(char))
     return number
 
 
 class ShortUUID(object):
-    __slots__ = ("_alphabet", "_alphabet_str", "_alpha_len", "_alphabet_index")
+    __slots__ = (
+        "_alphabet_str",
+        "_alpha_len",
+        "_alphabet_index",
+        "_alphabet_lut",
+        "_alphabet_bytes",
+        "_encode_table",
+        "_log_ratio",
+        "_length",
+        "_chunk",
+        "_chunk_digits",
+    )
 
     def __init__(
         self, alphabet: Optional[str] = None, dont_sort_alphabet: bool = False
     ) -> None:
-        if alphabet is None:
-            alphabet = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ" "abcdefghijkmnopqrstuvwxyz"
+        if alphabet is None or alphabet == DEFAULT_ALPHABET:
+            if not _DEFAULT_STATE:
+                self.set_alphabet(DEFAULT_ALPHABET)
+                # Iterate the base class's slots explicitly: subclasses may
+                # declare additional slots that are neither set yet nor part
+                # of the shared alphabet state.
+                _DEFAULT_STATE.update(
+                    {slot: getattr(self, slot) for slot in ShortUUID.__slots__}
+                )
+            else:
+                for slot in ShortUUID.__slots__:
+                    setattr(self, slot, _DEFAULT_STATE[slot])
+            return
 
         self.set_alphabet(alphabet, dont_sort_alphabet=dont_sort_alphabet)
 
-    @property
-    def _length(self) -> int:
-        """Return the necessary length to fit the entire UUID given the current alphabet."""
-        return int(math.ceil(math.log(2**128, self._alpha_len)))
-
     def encode(self, uuid: _uu.UUID, pad_length: Optional[int] = None) -> str:
         """
         Encode a UUID into a string (LSB first) according to the alphabet.
@@ -78,9 +107,55 @@ class ShortUUID(object):
         """
         if not isinstance(uuid, _uu.UUID):
             raise ValueError("Input `uuid` must be a UUID object.")
+        return self.encode_int(uuid.int, pad_length)
+
+    def encode_int(self, number: int, pad_length: Optional[int] = None) -> str:
+        """
+        Encode a 128-bit integer into a string according to the alphabet.
+
+        Like `encode`, but takes the integer directly so callers that already
+        hold one need not construct a UUID object first.
+        """
+        if number < 0:
+            raise ValueError("Input `number` must be non-negative.")
         if pad_length is None:
             pad_length = self._length
-        return int_to_string(uuid.int, self._alphabet, padding=pad_length)
+        if (
+            self._alphabet_bytes is not None
+            and pad_length >= self._length
+            and number < 1 << 128
+        ):
+            return self._encode_ascii(number, pad_length)
+        return int_to_string(number, self._alphabet_str, padding=pad_length)
+
+    def _encode_ascii(self, number: int, pad_length: int) -> str:
+        """
+        Encode a 128-bit number into a preallocated buffer of `pad_length` bytes.
+
+        Only valid for ASCII alphabets and a `pad_length` the number is
+        guaranteed to fit in; `encode` checks both before dispatching here.
+        """
+        alpha_len = self._alpha_len
+        # The zero-filled buffer holds digit values; the final translate maps
+        # every digit (including the zero-digit padding) to its alphabet
+        # character in one C call.
+        buf = bytearray(pad_length)
+        i = pad_length - 1
+        # Peel off as many digits as fit in a machine word per big-int divmod;
+        # the inner divmods then run on a small int, which is much cheaper
+        # than dividing the full 128-bit number once per digit.
+        chunk = self._chunk
+        while number >= chunk:
+            number, remainder = divmod(number, chunk)
+            for _ in range(self._chunk_digits):
+                remainder, digit = divmod(remainder, alpha_len)
+                buf[i] = digit
+                i -= 1
+        while number:
+            number, digit = divmod(number, alpha_len)
+            buf[i] = digit
+            i -= 1
+        return buf.translate(self._encode_table).decode("ascii")
 
     def decode(self, string: str, legacy: bool = False) -> _uu.UUID:
         """
@@ -93,11 +168,50 @@ class ShortUUID(object):
         Pass `legacy=True` if your UUID was encoded with a ShortUUID version prior to
         1.0.0.
         """
+        return _uu.UUID(int=self.decode_int(string, legacy))
+
+    def decode_int(self, string: str, legacy: bool = False) -> int:
+        """
+        Decode a string according to the current alphabet into a 128-bit integer.
+
+        Like `decode`, but skips constructing the UUID object for callers that
+        only need the number.
+        """
         if not isinstance(string, str):
             raise ValueError("Input `string` must be a str.")
         if legacy:
             string = string[::-1]
-        return _uu.UUID(int=string_to_int(string, self._alphabet, self._alphabet_index))
+        # Leading zero-digits only pad the value, so strip them before the
+        # oversize check: encodings made with a larger pad_length stay
+        # decodable, while pathological inputs are still rejected before any
+        # big-int arithmetic is done on them.
+        string = string.lstrip(self._alphabet_str[0])
+        if len(string) > self._length + 1:
+            raise ValueError(
+                "Input `string` is too long ({} significant characters > {}).".format(
+                    len(string), self._length + 1
+                )
+            )
+        lut = self._alphabet_lut
+        if lut is None:
+            # Non-ASCII alphabet; fall back to the dict-based conversion.
+            return string_to_int(string, self._alphabet_str, self._alphabet_index)
+        try:
+            data = string.encode("ascii")
+        except UnicodeEncodeError as e:
+            raise ValueError("'{}' is not in alphabet".format(string[e.start]))
+        # One C-level translate maps every byte to its digit at once; the
+        # Python loop below then only does the Horner reduction.
+        digits = data.translate(lut)
+        if 0xFF in digits:
+            raise ValueError(
+                "'{}' is not in alphabet".format(string[digits.index(0xFF)])
+            )
+        number = 0
+        alpha_len = self._alpha_len
+        for digit in digits:
+            number = number * alpha_len + digit
+        return number
 
     def uuid(self, name: Optional[str] = None, pad_length: Optional[int] = None) -> str:
         """
@@ -112,7 +226,7 @@ class ShortUUID(object):
         # If no name is given, generate a random UUID.
         if name is None:
             u = _uu.uuid4()
-        elif name.lower().startswith(("http://", "https://")):
+        elif name[:8].lower().startswith(("http://", "https://")):
             u = _uu.uuid5(_uu.NAMESPACE_URL, name)
         else:
             u = _uu.uuid5(_uu.NAMESPACE_DNS, name)
@@ -123,7 +237,50 @@ class ShortUUID(object):
         if length is None:
             length = self._length
 
-        return "".join(secrets.choice(self._alphabet) for _ in range(length))
+        return "".join(self._random_chars(length))
+
+    def random_many(self, count: int, length: Optional[int] = None) -> List[str]:
+        """
+        Generate and return `count` cryptographically secure short random strings.
+
+        Equivalent to calling `random` `count` times, but draws the randomness
+        for all strings in one batch, which is considerably faster for bulk
+        workflows such as fixture generation.
+        """
+        if length is None:
+            length = self._length
+        if not length:
+            return [""] * count
+
+        chars = self._random_chars(count * length)
+        return [
+            "".join(chars[start : start + length])
+            for start in range(0, count * length, length)
+        ]
+
+    def _random_chars(self, count: int) -> List[str]:
+        """Return `count` uniformly random alphabet characters."""
+        alphabet = self._alphabet_str
+        alpha_len = self._alpha_len
+        if alpha_len > 256:
+            # Single bytes cannot cover the alphabet; the byte-based fast
+            # paths below would skip characters past the first 256.
+            return [secrets.choice(alphabet) for _ in range(count)]
+        if alpha_len & (alpha_len - 1) == 0:
+            # Power-of-two alphabet: masking bytes introduces no bias.
+            mask = alpha_len - 1
+            return [alphabet[byte & mask] for byte in secrets.token_bytes(count)]
+        # Draw random bytes in batches and rejection-sample below the largest
+        # multiple of alpha_len, so every symbol stays equally likely while
+        # avoiding one secrets.choice() call (and OS entropy fetch) per
+        # character.
+        limit = 256 - (256 % alpha_len)
+        chars: List[str] = []
+        while len(chars) < count:
+            for byte in secrets.token_bytes(count - len(chars) + 8):
+                if byte < limit:
+                    chars.append(alphabet[byte % alpha_len])
+        return chars[:count]
 
     def get_alphabet(self) -> str:
         """Return the current alphabet used for new UUIDs."""
@@ -132,34 +289,85 @@ class ShortUUID(object):
     def set_alphabet(self, alphabet: str, dont_sort_alphabet: bool = False) -> None:
         """Set the alphabet to be used for new UUIDs."""
         # Turn the alphabet into a set and sort it to prevent duplicates
-        # and ensure reproducibility.
-        new_alphabet = (
-            list(dict.fromkeys(alphabet))
-            if dont_sort_alphabet
-            else list(sorted(set(alphabet)))
-        )
+        # and ensure reproducibility. The default alphabet is already unique
+        # and sorted, so it skips the dedupe and sort.
+        if alphabet == DEFAULT_ALPHABET:
+            new_alphabet = list(DEFAULT_ALPHABET)
+        else:
+            new_alphabet = (
+                list(dict.fromkeys(alphabet))
+                if dont_sort_alphabet
+                else list(sorted(set(alphabet)))
+            )
+        new_alphabet_str = "".join(new_alphabet)
+        if getattr(self, "_alphabet_str", None) == new_alphabet_str:
+            # Canonicalized alphabet is unchanged; all derived state is
+            # already current.
+            return
         if len(new_alphabet) > 1:
-            self._alphabet = new_alphabet
-            self._alphabet_str = "".join(new_alphabet)
-            self._alpha_len = len(self._alphabet)
+            self._alphabet_str = new_alphabet_str
+            self._alpha_len = len(new_alphabet)
+            # Cache the bytes-to-characters log ratio (used by
+            # encoded_length) so it is not recomputed per call.
+            self._log_ratio = math.log(256) / math.log(self._alpha_len)
+            # Smallest digit count whose capacity covers 2**128, computed in
+            # exact integer arithmetic to avoid float-log rounding surprises.
+            length = 1
+            capacity = self._alpha_len
+            while capacity < (1 << 128):
+                capacity *= self._alpha_len
+                length += 1
+            self._length = length
+            # Largest power of the alphabet size that fits in a 64-bit word,
+            # used to extract several digits per big-int division in encode.
+            chunk = self._alpha_len
+            chunk_digits = 1
+            while chunk * self._alpha_len < (1 << 63):
+                chunk *= self._alpha_len
+                chunk_digits += 1
+            self._chunk = chunk
+            self._chunk_digits = chunk_digits
             # Cache char->index mapping for O(1) lookups in decode()
             self._alphabet_index = {
-                char: idx for idx, char in enumerate(self._alphabet)
+                char: idx for idx, char in enumerate(new_alphabet)
             }
+            # For ASCII alphabets, also cache a 256-entry byte->digit table
+            # (0xFF marks bytes outside the alphabet). decode() feeds the
+            # encoded bytes of a string through bytes.translate() with this
+            # table, turning all per-character lookups into a single C call.
+            if all(ord(char) < 128 for char in new_alphabet):
+                lut = bytearray(b"\xff" * 256)
+                for idx, char in enumerate(new_alphabet):
+                    lut[ord(char)] = idx
+                self._alphabet_lut: Optional[bytes] = bytes(lut)
+                self._alphabet_bytes: Optional[bytes] = self._alphabet_str.encode(
+                    "ascii"
+                )
+                # Inverse table for encoding: digit value -> alphabet byte.
+                # Entries past the alphabet never occur in the digit buffer.
+                self._encode_table: Optional[bytes] = self._alphabet_bytes + bytes(
+                    256 - self._alpha_len
+                )
+            else:
+                self._alphabet_lut = None
+                self._alphabet_bytes = None
+                self._encode_table = None
         else:
             raise ValueError("Alphabet with more than " "one unique symbols required.")
 
     def encoded_length(self, num_bytes: int = 16) -> int:
         """Return the string length of the shortened UUID."""
-        factor = math.log(256) / math.log(self._alpha_len)
-        return int(math.ceil(factor * num_bytes))
+        return int(math.ceil(self._log_ratio * num_bytes))
 
 
 # For backwards compatibility
 _global_instance = ShortUUID()
 encode = _global_instance.encode
+encode_int = _global_instance.encode_int
 decode = _global_instance.decode
+decode_int = _global_instance.decode_int
 uuid = _global_instance.uuid
 random = _global_instance.random
+random_many = _global_instance.random_many
 get_alphabet = _global_instance.get_alphabet
 set_alphabet = _global_instance.set_alphabet
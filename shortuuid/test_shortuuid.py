@@ -84,6 +84,26 @@ class ClassShortUUIDTest(unittest.TestCase):
         u = UUID("{3b1f8b40-222c-4a6e-b77e-779d5a94e21c}")
         self.assertEqual(su.decode("CXc85b4rqinB7s5J52TRYb"), u)
 
+    def test_int_encoding(self):
+        su = ShortUUID()
+        u = UUID("{3b1f8b40-222c-4a6e-b77e-779d5a94e21c}")
+        self.assertEqual(su.encode_int(u.int), "CXc85b4rqinB7s5J52TRYb")
+        self.assertEqual(su.decode_int("CXc85b4rqinB7s5J52TRYb"), u.int)
+
+        u = uuid4()
+        self.assertEqual(u.int, su.decode_int(su.encode_int(u.int)))
+
+        self.assertRaises(ValueError, su.encode_int, -1)
+
+    def test_subclass_with_slots(self):
+        class CustomShortUUID(ShortUUID):
+            __slots__ = ("_extra",)
+
+        su = CustomShortUUID()
+        self.assertEqual(len(su.get_alphabet()), 57)
+        u = uuid4()
+        self.assertEqual(u, su.decode(su.encode(u)))
+
     def test_random(self):
         su = ShortUUID()
         for i in range(1000):
@@ -92,6 +112,24 @@ class ClassShortUUIDTest(unittest.TestCase):
         for i in range(1, 100):
             self.assertEqual(len(su.random(i)), i)
 
+    def test_random_large_alphabet(self):
+        alphabet = "".join(chr(0x4E00 + i) for i in range(300))
+        su = ShortUUID(alphabet)
+        self.assertEqual(len(su.random(50)), 50)
+        self.assertTrue(set(su.random(50)) <= set(alphabet))
+
+    def test_random_many(self):
+        su = ShortUUID()
+        strings = su.random_many(100)
+        self.assertEqual(len(strings), 100)
+        for string in strings:
+            self.assertEqual(len(string), 22)
+
+        for i in range(1, 10):
+            self.assertEqual(len(su.random_many(i, length=7)), i)
+
+        self.assertEqual(su.random_many(3, length=0), ["", "", ""])
+
     def test_alphabet(self):
         alphabet = "01"
         su1 = ShortUUID(alphabet)
@@ -179,6 +217,14 @@ class ShortUUIDPaddingTest(unittest.TestCase):
         self.assertEqual(su.decode(encoded_small), smallest_uid)
         self.assertEqual(su.decode(encoded_random), random_uid)
 
+    def test_oversize_padding(self):
+        su = ShortUUID()
+        random_uid = uuid4()
+
+        encoded = su.encode(random_uid, pad_length=30)
+        self.assertEqual(len(encoded), 30)
+        self.assertEqual(su.decode(encoded), random_uid)
+
     def test_consistency(self):
         su = ShortUUID()
         num_iterations = 1000
@@ -221,6 +267,10 @@ class DecodingEdgeCasesTest(unittest.TestCase):
         su = ShortUUID("abc")
         self.assertRaises(ValueError, su.decode, "xyz")
 
+    def test_decode_oversize_string(self):
+        su = ShortUUID()
+        self.assertRaises(ValueError, su.decode, "x" * 1000)
+
 
 class CliTest(unittest.TestCase):
     @patch("shortuuid.cli.print")